@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+"""
+Build script for the optional C extension modules.
+
+Invoked by pdm-backend (run-setuptools = true); all package metadata lives
+in pyproject.toml. The extensions are marked optional, so the package
+still builds as pure Python on systems without a C compiler.
+"""
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "iec_pas_63343._iec_checksum",
+            sources=["src/iec_pas_63343/_iec_checksum.c"],
+            optional=True),
+    ],
+)
@@ -0,0 +1,72 @@
+/*
+ * C implementation of the IEC 61162-1 sentence checksum.
+ *
+ * Built as an optional extension module; iec_pas_63343.sentences falls
+ * back to the pure-Python implementation when it is unavailable.
+ *
+ * @author: Jan Safar
+ *
+ * Copyright 2024 GLA Research and Development Directorate
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *
+iec_checksum(PyObject *module, PyObject *arg)
+{
+    Py_ssize_t n, i;
+    const char *p;
+    unsigned char checksum = 0;
+    Py_buffer view;
+
+    /* The first character ("!" or "$") is excluded from the checksum */
+    if (PyUnicode_Check(arg)) {
+        p = PyUnicode_AsUTF8AndSize(arg, &n);
+        if (p == NULL)
+            return NULL;
+        for (i = 1; i < n; i++)
+            checksum ^= (unsigned char)p[i];
+    }
+    else {
+        if (PyObject_GetBuffer(arg, &view, PyBUF_SIMPLE) < 0)
+            return NULL;
+        p = (const char *)view.buf;
+        for (i = 1; i < view.len; i++)
+            checksum ^= (unsigned char)p[i];
+        PyBuffer_Release(&view);
+    }
+
+    return PyLong_FromLong(checksum);
+}
+
+static PyMethodDef iec_checksum_methods[] = {
+    {"iec_checksum", iec_checksum, METH_O,
+     "Calculate the checksum of an IEC 61162-1 sentence (str or bytes)."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef iec_checksum_module = {
+    PyModuleDef_HEAD_INIT,
+    "_iec_checksum",
+    "C implementation of the IEC 61162-1 sentence checksum.",
+    -1,
+    iec_checksum_methods
+};
+
+PyMODINIT_FUNC
+PyInit__iec_checksum(void)
+{
+    return PyModule_Create(&iec_checksum_module);
+}
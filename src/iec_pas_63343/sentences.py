@@ -26,18 +26,154 @@ limitations under the License.
 # =============================================================================
 # %% Import Statements
 # =============================================================================
-# Built-in Modules ------------------------------------------------------------
-from math import ceil
-
 # Third-party Modules ---------------------------------------------------------
 from bitstring import BitStream
 
-# Local Modules ---------------------------------------------------------------
-from iec_61162.part_1.sentences import iec_checksum, iec_ascii_6b_to_8b
+# Optional third-party modules, used to accelerate payload encoding when
+# available (installable via the "perf" extra).
+try:
+    import numpy as np
+    from numba import int64, njit
+except ImportError:
+    njit = None
 
 # =============================================================================
 # %% Helper Functions
 # =============================================================================
+# 6-bit binary value to 8-bit ASCII character conversion table, as per
+# IEC 61162-1 / ITU-R M.1371.
+_ASCII_6B_LUT = bytes(v + 48 if v < 40 else v + 56 for v in range(64))
+
+if njit is not None:
+    _ASCII_6B_LUT_NP = np.frombuffer(_ASCII_6B_LUT, dtype=np.uint8)
+
+    @njit(cache=True)
+    def _pack_6b_ascii_nb(raw, n_char, lut, out):
+        """
+        Numba kernel for _pack_6b_ascii.
+
+        Reads raw (uint8 array) six bits at a time and writes n_char ASCII
+        bytes into out (uint8 array of size n_char), using the 64-entry
+        conversion table lut.
+
+        """
+        acc = 0
+        bitpos = 0
+        j = 0
+        for i in range(raw.size):
+            # Cast the uint8 explicitly to keep the accumulator signed
+            acc = ((acc << 8) | int64(raw[i])) & 0xFFFF
+            bitpos += 8
+            while bitpos >= 6 and j < n_char:
+                bitpos -= 6
+                out[j] = lut[(acc >> bitpos) & 0x3F]
+                j += 1
+        if j < n_char:
+            out[j] = lut[(acc << (6 - bitpos)) & 0x3F]
+
+
+def _pack_6b_ascii(raw, nbits_total):
+    """
+    Pack a bitstream into valid characters of the 6-bit ASCII encoding.
+
+    Byte-level replacement for the BitStream concatenation +
+    iec_61162.part_1.sentences.iec_ascii_6b_to_8b pair: the bitstream is
+    read six bits at a time through a rolling accumulator and each group
+    is mapped to its ASCII character via a 64-entry lookup table. Fill
+    bits are never materialised; any part of the last 6-bit group lying
+    beyond the raw data is simply packed as zero bits.
+
+    Parameters
+    ----------
+    raw : bytes
+        Bitstream data, padded with zero bits to a byte boundary.
+    nbits_total : int
+        Length of the bitstream in bits, including the (zero) fill bits
+        that make it a multiple of six.
+
+    Returns
+    -------
+    bytes
+        The bitstream encoded as 6-bit ASCII.
+
+    """
+    n_char = nbits_total // 6
+
+    if njit is not None:
+        out = np.empty(n_char, dtype=np.uint8)
+        _pack_6b_ascii_nb(
+            np.frombuffer(raw, dtype=np.uint8), n_char, _ASCII_6B_LUT_NP, out)
+        return out.tobytes()
+
+    # Bind the lookup table and the append method to locals; saves a
+    # global/attribute lookup per character in the loop below
+    lut = _ASCII_6B_LUT
+
+    out = bytearray()
+    append = out.append
+    acc = 0
+    bitpos = 0
+    for byte in raw:
+        acc = ((acc << 8) | byte) & 0xFFFF
+        bitpos += 8
+        while bitpos >= 6 and len(out) < n_char:
+            bitpos -= 6
+            append(lut[(acc >> bitpos) & 0x3F])
+
+    # Fill bits extending beyond the last byte of raw data
+    if len(out) < n_char:
+        out.append(lut[(acc << (6 - bitpos)) & 0x3F])
+
+    return bytes(out)
+
+
+def _iec_checksum_py(s):
+    """
+    Calculate the checksum of an IEC 61162-1 sentence.
+
+    SWAR (SIMD-within-a-register) equivalent of
+    iec_61162.part_1.sentences.iec_checksum; packs the ASCII byte buffer
+    into 64-bit words, XOR-reduces those and folds the accumulator down to
+    a single byte. XOR is associative and commutative, so the result is
+    identical to XOR-ing the characters one by one in a Python loop, at
+    roughly an eighth of the iteration count.
+
+    Parameters
+    ----------
+    s : str or bytes
+        Sentence. The first character ("!" or "$") is excluded from the
+        checksum calculation.
+
+    Returns
+    -------
+    int
+        Sentence checksum (0-255).
+
+    """
+    buf = s[1:].encode("ascii") if isinstance(s, str) else memoryview(s)[1:]
+    n_whole = len(buf) & ~7
+
+    x = 0
+    for i in range(0, n_whole, 8):
+        x ^= int.from_bytes(buf[i:i + 8], "little")
+
+    # A short tail behaves as if zero-padded to 8 bytes (XOR identity)
+    if n_whole < len(buf):
+        x ^= int.from_bytes(buf[n_whole:], "little")
+
+    x ^= x >> 32
+    x ^= x >> 16
+    x ^= x >> 8
+
+    return x & 0xFF
+
+
+# Use the C implementation of the checksum where the optional extension
+# module has been built; fall back to the pure-Python version otherwise.
+try:
+    from iec_pas_63343._iec_checksum import iec_checksum
+except ImportError:
+    iec_checksum = _iec_checksum_py
 
 
 # =============================================================================
@@ -47,6 +183,10 @@ class ABBSentence:
     """
     ABB Sentence: ASM broadcast message.
 
+    Sentence fields are treated as immutable after construction; the
+    invariant parts of the sentence string are pre-formatted in the
+    constructor.
+
     Parameters
     ----------
     n_sentences : int
@@ -83,6 +223,20 @@ class ABBSentence:
         shall be set to null (""). The default is "".
 
     """
+    __slots__ = (
+        "n_sentences",
+        "i_sentence",
+        "sequential_id",
+        "source_id",
+        "channel",
+        "transmission_format",
+        "payload",
+        "n_fill_bits",
+        "talker_id",
+        "asm_id",
+        "_prefix",
+        "_tail")
+
     formatter_code = "ABB"
 
     def __init__(
@@ -109,38 +263,81 @@ class ABBSentence:
         self.talker_id = talker_id
         self.asm_id = asm_id
 
+        # All fields other than i_sentence and payload are invariant for
+        # the lifetime of the sentence (and shared by all sentences of a
+        # multi-sentence message); pre-format them once here.
+        src = source_id if source_id == "" else str(source_id)
+        self._prefix = f"!{talker_id}{self.formatter_code},{n_sentences:02d}"
+        self._tail = (f",{sequential_id:d},{src},{channel:d},{asm_id},"
+                      f"{transmission_format:d}")
+
     @property
-    def string(self):
+    def bytes(self):
         """
         Returns
         -------
-        s : str
-            Sentence string, formatted as per the draft IEC VDES ASM PAS,
-            Oct. 2020.
+        b : bytes
+            Sentence encoded as ASCII bytes, formatted as per the draft
+            IEC VDES ASM PAS, Oct. 2020. This is the wire format; the
+            checksum is calculated directly on the encoded buffer.
 
         """
-        s = "!{:s}{:s},{:02d},{:02d},{:d},{:s},{:d},{:s},{:d},{:s},{:d}".format(
-            self.talker_id,
-            self.formatter_code,
-            self.n_sentences,
+        # Bind the fields to locals up front; the f-string below then runs
+        # on LOAD_FAST only
+        prefix, tail, i_sentence, payload, n_fill_bits = (
+            self._prefix,
+            self._tail,
             self.i_sentence,
-            self.sequential_id,
-            self.source_id if self.source_id == "" else str(self.source_id),
-            self.channel,
-            self.asm_id,
-            self.transmission_format,
             self.payload,
             self.n_fill_bits)
 
-        checksum = iec_checksum(s)
-        s += "*" + "{:>02X}".format(checksum) + "\r\n"
+        b = (f"{prefix},{i_sentence:02d}{tail},"
+             f"{payload},{n_fill_bits:d}").encode("ascii")
+
+        checksum = iec_checksum(b)
+
+        return b + f"*{checksum:02X}\r\n".encode("ascii")
+
+    @property
+    def string(self):
+        """
+        Returns
+        -------
+        s : str
+            Sentence string, formatted as per the draft IEC VDES ASM PAS,
+            Oct. 2020.
 
-        return s
+        """
+        return self.bytes.decode("ascii")
 
 
 # =============================================================================
 # %% Sentence Generation
 # =============================================================================
+def render_abb_batch(sentences):
+    """
+    Render a batch of ABB sentences as a single string.
+
+    Formats each sentence exactly once and concatenates the results with
+    one str.join, avoiding the repeated string concatenation (and repeated
+    string property evaluation) that a caller-side loop would incur.
+
+    Parameters
+    ----------
+    sentences : list of ABBSentence
+        Sentences to render, e.g. as returned by
+        asm_payload_bs_to_abb_sentences.
+
+    Returns
+    -------
+    str
+        The concatenated sentence strings, each terminated with <CR><LF>,
+        ready for output to the communication interface.
+
+    """
+    return "".join([sentence.string for sentence in sentences])
+
+
 def asm_payload_bs_to_abb_sentences(
         bs,
         sequential_id,
@@ -148,7 +345,9 @@ def asm_payload_bs_to_abb_sentences(
         channel,
         transmission_format,
         talker_id="AI",
-        asm_id=""):
+        asm_id="",
+        *,
+        nbits=None):
     """
     Encapsulate an ASM payload bitstream in an ABB sentence(s).
 
@@ -157,8 +356,10 @@ def asm_payload_bs_to_abb_sentences(
 
     Parameters
     ----------
-    bs : bitstring.BitStream
+    bs : bitstring.BitStream or bytes or bytearray
         ASM payload bitstream (the Binary Data portion of the message).
+        Passing raw bytes avoids the BitStream wrapping and copy for the
+        common byte-aligned case.
     sequential_id : int
         Sequential message identifier (0-9).
     source_id : int
@@ -183,6 +384,10 @@ def asm_payload_bs_to_abb_sentences(
     asm_id : str, optional
         ASM message ID as per Rec. ITU-R M.2092. Reserved for future use;
         shall be set to null (""). The default is "".
+    nbits : int, optional
+        Payload length in bits; only relevant when bs is given as raw
+        bytes and the payload is not byte-aligned. The default is None
+        (all bits of bs).
 
     Returns
     -------
@@ -190,46 +395,70 @@ def asm_payload_bs_to_abb_sentences(
         List of ABB sentences encapsulating the ASM payload bitstream.
 
     """
-    n_bits = len(bs)
-    n_fill_bits = int((6 - (n_bits % 6)) % 6)
+    if isinstance(bs, (bytes, bytearray)):
+        raw = bs
+        n_bits = nbits if nbits is not None else len(bs) * 8
+    else:
+        raw = bs.tobytes()
+        n_bits = len(bs)
 
-    bs += BitStream(n_fill_bits)
+    # Single-modulo equivalent of (6 - (n_bits % 6)) % 6
+    n_fill_bits = -n_bits % 6
 
-    payload = iec_ascii_6b_to_8b(bs)
+    payload = _pack_6b_ascii(raw, n_bits + n_fill_bits)
 
     # Split into multiple sentences if necessary and add NMEA/IEC armouring
-    i_sentence = 1
-    payload_offset = 0
     # Maximum number of characters per payload for the ABB sentence.
     # Assuming the max number of characters per sentence is 82 (as per
     # IEC 61162-1) and that all sentence fields are populated (no null
     # fields) as per the draft IEC PAS for VDES ASM.
     max_payload_char = 42
-    n_sentences = ceil(len(payload) / max_payload_char)
-
-    sentences = []
-    while i_sentence <= n_sentences:
-
-        # FIXME: n_fill_bits should probably be 0 for all sentences but the
-        # last one.
-        abb_sentence = ABBSentence(
-            n_sentences=n_sentences,
-            i_sentence=i_sentence,
+    # Ceiling division in the integer domain (avoids the float round-trip
+    # of math.ceil)
+    n_sentences = -(-len(payload) // max_payload_char)
+
+    # Fast path for the common case of a payload fitting in a single
+    # sentence: no slicing loop required
+    if n_sentences == 1:
+        return [ABBSentence(
+            n_sentences=1,
+            i_sentence=1,
             sequential_id=sequential_id,
             channel=channel,
             transmission_format=transmission_format,
-            payload=payload[
-                payload_offset:(payload_offset + max_payload_char)],
+            payload=payload.decode("ascii"),
             n_fill_bits=n_fill_bits,
             source_id=source_id,
             talker_id=talker_id,
-            asm_id=asm_id)
-
-        i_sentence += 1
-
-        payload_offset += max_payload_char
-
-        sentences += [abb_sentence]
+            asm_id=asm_id)]
+
+    # Keyword arguments shared by all sentences of the message
+    # FIXME: n_fill_bits should probably be 0 for all sentences but the
+    # last one.
+    common_kwargs = dict(
+        n_sentences=n_sentences,
+        sequential_id=sequential_id,
+        channel=channel,
+        transmission_format=transmission_format,
+        n_fill_bits=n_fill_bits,
+        source_id=source_id,
+        talker_id=talker_id,
+        asm_id=asm_id)
+
+    # Local binding avoids a global lookup per iteration
+    abb_sentence = ABBSentence
+
+    sentences = [None] * n_sentences
+    for i in range(n_sentences):
+
+        payload_offset = i * max_payload_char
+
+        sentences[i] = abb_sentence(
+            i_sentence=i + 1,
+            payload=payload[
+                payload_offset:(payload_offset + max_payload_char)].decode(
+                    "ascii"),
+            **common_kwargs)
 
     return sentences
 
@@ -256,13 +485,15 @@ class SentenceGenerator:
             asm_payload_bs,
             source_id,
             channel,
-            transmission_format):
+            transmission_format,
+            *,
+            nbits=None):
         """
         Generate ABB sentence(s) encapsulating an ASM payload.
 
         Parameters
         ----------
-        asm_payload_bs : bitstring.BitStream
+        asm_payload_bs : bitstring.BitStream or bytes or bytearray
             ASM payload bitstream (the Binary Data portion of an ASM).
         source_id : int
             Source ID (10 digits as per the draft IEC VDES-ASM PAS; VDES1000
@@ -281,6 +512,10 @@ class SentenceGenerator:
             - 1: 3/4 FEC
             - 2: ASM SAT uplink message
             - 3-9: Reserved for future use.
+        nbits : int, optional
+            Payload length in bits; only relevant when asm_payload_bs is
+            given as raw bytes and the payload is not byte-aligned. The
+            default is None (all bits of asm_payload_bs).
 
         Returns
         -------
@@ -294,7 +529,8 @@ class SentenceGenerator:
             sequential_id=self.abb_sequential_id,
             source_id=source_id,
             channel=channel,
-            transmission_format=transmission_format)
+            transmission_format=transmission_format,
+            nbits=nbits)
 
         # If this is a multi-sentence message, increase the Sequential ID
         if len(abb_sentences) > 1: